@@ -14,6 +14,9 @@ Features
 Requirements:
 - Python 3.8+
 - pygame (pip install pygame)
+- numpy (optional, pip install numpy) for faster sky generation and particle simulation;
+  without it particles fall back to the pure-Python ParticleList
+- numba (optional, pip install numba) for compiled particle physics
 
 Run:
 python DuckHunt.py
@@ -22,8 +25,20 @@ import pygame
 import random
 import math
 import sys
+import array
+import time
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # -------------------- Config --------------------
 TOTAL_LEVELS = 10
 HEALTH_PER_LEVEL = 5
@@ -31,6 +46,8 @@ DUCKS_TO_CLEAR = 10          # hits required per level
 BULLETS_AFTER_LEVEL_5 = 15    # bullets available starting from level 6
 SCREEN_W, SCREEN_H = 1000, 640
 FPS = 60
+FIXED_DT = 1.0 / FPS          # physics step; rendering is paced to it
+MAX_FRAME_TIME = 0.25         # cap on simulated time per frame (avoids spiral of death)
 
 # Graphics tuning
 DUCK_BASE_SPEED = 120
@@ -44,6 +61,7 @@ SKY_BOTTOM = (88, 151, 215)
 GRASS = (60, 145, 70)
 GROUND_DARK = (35, 100, 40)
 CLOUD_COLOR = (255, 255, 255, 220)
+PARTICLE_COLOR = (255, 220, 110)
 
 # Safety for mixer if not available
 SOUND_ENABLED = True
@@ -57,7 +75,6 @@ except Exception:
 
 screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
 pygame.display.set_caption('Duck Hunt — Improved Graphics')
-clock = pygame.time.Clock()
 
 # Fonts
 def get_font(name, size, bold=False):
@@ -82,6 +99,9 @@ except Exception:
     pass
 
 # -------------------- Utility --------------------
+# game-wide random source; a local instance skips the module-level indirection
+_RNG = random.Random()
+
 def clamp(x, a, b):
     return max(a, min(b, x))
 
@@ -89,14 +109,90 @@ def lerp(a, b, t):
     return a + (b - a) * t
 
 # -------------------- Visual helpers --------------------
-def draw_sky_gradient(surf):
-    # vertical gradient
+def batch_blit(surf, seq):
+    # blit many (source, pos) pairs in one call; fblits is pygame-ce only
+    if hasattr(surf, 'fblits'):
+        surf.fblits(seq)
+    else:
+        surf.blits(seq, doreturn=False)
+
+def _render_sky_gradient():
+    sky = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+    if np is not None:
+        # vectorized ramp: (H, 3) colors broadcast across the width
+        ramp = np.stack([np.linspace(SKY_TOP[i], SKY_BOTTOM[i], SCREEN_H, endpoint=False)
+                         for i in range(3)], axis=1).astype(np.uint8)
+        arr = np.broadcast_to(ramp[None, :, :], (SCREEN_W, SCREEN_H, 3))
+        pygame.surfarray.blit_array(sky, np.ascontiguousarray(arr))
+        return sky
+    # vertical gradient: fill a single column, then stretch it across the width
+    col = pygame.Surface((1, SCREEN_H))
     for y in range(SCREEN_H):
         t = y / SCREEN_H
         r = int(lerp(SKY_TOP[0], SKY_BOTTOM[0], t))
         g = int(lerp(SKY_TOP[1], SKY_BOTTOM[1], t))
         b = int(lerp(SKY_TOP[2], SKY_BOTTOM[2], t))
-        pygame.draw.line(surf, (r, g, b), (0, y), (SCREEN_W, y))
+        col.set_at((0, y), (r, g, b))
+    pygame.transform.scale(col, (SCREEN_W, SCREEN_H), sky)
+    return sky
+
+# the gradient never changes, so render it once and blit it every frame
+_SKY_SURFACE = _render_sky_gradient()
+
+def draw_sky_gradient(surf):
+    surf.blit(_SKY_SURFACE, (0, 0))
+
+def _render_crosshair():
+    # 48x48 crosshair centered at (24, 24)
+    s = pygame.Surface((48, 48), pygame.SRCALPHA).convert_alpha()
+    c = 24
+    pygame.draw.circle(s, WHITE, (c, c), 12, 2)
+    pygame.draw.line(s, WHITE, (c-22, c), (c-8, c), 2)
+    pygame.draw.line(s, WHITE, (c+8, c), (c+22, c), 2)
+    pygame.draw.line(s, WHITE, (c, c-22), (c, c-8), 2)
+    pygame.draw.line(s, WHITE, (c, c+8), (c, c+22), 2)
+    return s
+
+_CROSSHAIR = _render_crosshair()
+
+def _render_heart(color):
+    # simple 24x24 heart for the HUD health bar
+    s = pygame.Surface((24, 24), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.ellipse(s, color, (4, 6, 12, 12))
+    pygame.draw.ellipse(s, color, (12, 6, 12, 12))
+    pygame.draw.polygon(s, color, [(4, 12), (12, 22), (20, 12)])
+    return s
+
+_HEART_FULL = _render_heart((255,80,90))
+_HEART_EMPTY = _render_heart((220,220,220))
+
+def _render_ground():
+    # grass band along the bottom of the screen
+    s = pygame.Surface((SCREEN_W, 120)).convert()
+    s.fill(GRASS)
+    # subtle ground stripes
+    stripe = pygame.Surface((30, 80)).convert()
+    stripe.fill(GROUND_DARK)
+    batch_blit(s, [(stripe, (i, 40)) for i in range(0, SCREEN_W, 60)])
+    return s
+
+_GROUND = _render_ground()
+
+def _render_cloud(w, h):
+    # cloud surface for soft alpha
+    s = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+    # draw multiple overlapping ellipses
+    for i in range(6):
+        rx = int(w * (0.2 + _RNG.random() * 0.6))
+        ry = int(h * (0.5 + _RNG.random() * 0.4))
+        ox = int(_RNG.random() * (w - rx))
+        oy = int(_RNG.random() * (h - ry))
+        alpha = 200 - i * 20
+        pygame.draw.ellipse(s, (255,255,255,alpha), (ox, oy, rx, ry))
+    return s
+
+# a few cloud shapes at the largest cloud scale; each Cloud resamples one
+_BASE_CLOUDS = [_render_cloud(int(260 * 1.4), int(80 * 1.4)) for _ in range(3)]
 
 class Cloud:
     def __init__(self, x, y, scale, speed):
@@ -106,38 +202,48 @@ class Cloud:
         self.speed = speed
         self.w = int(260 * scale)
         self.h = int(80 * scale)
-        # cloud surface for soft alpha
-        self.surface = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+        self.last_rect = None   # where it was drawn last frame
         self._render()
 
     def _render(self):
-        s = self.surface
-        s.fill((0,0,0,0))
-        # draw multiple overlapping ellipses
-        for i in range(6):
-            rx = int(self.w * (0.2 + random.random() * 0.6))
-            ry = int(self.h * (0.5 + random.random() * 0.4))
-            ox = int(random.random() * (self.w - rx))
-            oy = int(random.random() * (self.h - ry))
-            alpha = 200 - i * 20
-            pygame.draw.ellipse(s, (255,255,255,alpha), (ox, oy, rx, ry))
+        base = _RNG.choice(_BASE_CLOUDS)
+        s = pygame.transform.smoothscale(base, (self.w, self.h))
+        if _RNG.random() < 0.5:
+            s = pygame.transform.flip(s, True, False)
+        self.surface = s
 
     def update(self, dt):
         self.x += self.speed * dt
         if self.speed > 0 and self.x - self.w > SCREEN_W + 100:
-            self.x = -self.w - random.randint(0, 200)
+            self.x = -self.w - _RNG.randint(0, 200)
         if self.speed < 0 and self.x + self.w < -200:
-            self.x = SCREEN_W + random.randint(0, 200)
+            self.x = SCREEN_W + _RNG.randint(0, 200)
+
+    def rect(self):
+        return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
 
     def draw(self, surf):
         surf.blit(self.surface, (int(self.x), int(self.y)))
 
 # -------------------- Game objects --------------------
+def _on_screen(r):
+    # cheap AABB test against the window
+    return r.right > 0 and r.left < SCREEN_W and r.bottom > 0 and r.top < SCREEN_H
+
+# sine lookup table for the duck wobble, indexed by phase * 256
+_SIN_LUT = array.array('f', [math.sin(2 * math.pi * i / 256) for i in range(256)])
+# wing offsets for 32 quantized flap phases
+_WING_OFFSETS = [int(math.sin(2 * math.pi * i / 32) * 12) for i in range(32)]
+_FLAP_TO_PHASE = 32 / (2 * math.pi)
+
 class Duck:
+    # soft shadows are identical for ducks of the same size: (w, h) -> Surface
+    _SHADOW_CACHE = {}
+
     def __init__(self, level:int):
         self.level = level
-        side = random.choice(['left', 'right'])
-        self.y = random.randint(110, SCREEN_H - 220)
+        side = _RNG.choice(['left', 'right'])
+        self.y = _RNG.randint(110, SCREEN_H - 220)
         if side == 'left':
             self.x = -80
             self.vx = 1
@@ -146,97 +252,138 @@ class Duck:
             self.vx = -1
         speed_factor = 1.0 + (level - 1) * 0.12
         dir_sign = 1 if self.vx > 0 else -1
-        self.vx = dir_sign * DUCK_BASE_SPEED * speed_factor * (0.95 + random.random() * 0.35)
-        self.amp = 18 + random.random() * 18
-        self.period = 1.0 + random.random() * 1.6
+        self.vx = dir_sign * DUCK_BASE_SPEED * speed_factor * (0.95 + _RNG.random() * 0.35)
+        self.amp = 18 + _RNG.random() * 18
+        self.period = 1.0 + _RNG.random() * 1.6
+        self._lut_step = 256 / self.period
         self.age = 0.0
         self.dead = False
         self.fall_speed = 0.0
         self.hit_anim = 0.0
         self.width = int(68 * DUCK_SCALE)
         self.height = int(56 * DUCK_SCALE)
-        self.flap = random.random() * 2 * math.pi
+        self.flap = _RNG.random() * 2 * math.pi
         # color palette (vary slightly by level)
         base = clamp(140 + level * 6, 140, 250)
         self.body_color = (base, clamp(90 + level*3, 90, 200), clamp(50, 50, 180))
         self.wing_color = (clamp(base+30,0,255), clamp(140 + level*2,0,255), clamp(90,0,255))
         self.head_color = (60, 70, 95)
         self.spawn_time = 0.0
+        shadow_key = (int(self.width * 1.1), int(self.height * 0.4))
+        self._shadow = Duck._SHADOW_CACHE.get(shadow_key)
+        if self._shadow is None:
+            shadow_w, shadow_h = shadow_key
+            self._shadow = pygame.Surface(shadow_key, pygame.SRCALPHA).convert_alpha()
+            pygame.draw.ellipse(self._shadow, (0,0,0,90), (0, 0, shadow_w, shadow_h))
+            Duck._SHADOW_CACHE[shadow_key] = self._shadow
+        self.last_rect = None   # where it was drawn last frame
+        self._render()
+
+    def _render(self):
+        # bake the body, wing and head into sprites once; sprites() only positions them
+        w, h = self.width, self.height
+        # body ellipse with subtle shading (two ellipses)
+        self._body = pygame.Surface((w + 6, h + 6), pygame.SRCALPHA).convert_alpha()
+        dark = tuple(clamp(c-20,0,255) for c in self.body_color)
+        pygame.draw.ellipse(self._body, dark, (6, 6, w, h))
+        pygame.draw.ellipse(self._body, self.body_color, (0, 0, w, h))
+        # wing, translated by the flap animation in sprites()
+        self._wing = pygame.Surface((int(w*0.9), int(h*0.6)), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.ellipse(self._wing, self.wing_color, self._wing.get_rect())
+        # head + beak + eye, one sprite per facing (pygame's ellipses aren't
+        # symmetric, so a flipped sprite would not match the original look)
+        self._head_r = self._render_head(True)
+        self._head_l = self._render_head(False)
+        # area covered by all sprites relative to (x, y), for any flap phase
+        shadow_w, shadow_h = self._shadow.get_size()
+        common = [pygame.Rect(-shadow_w//2, h//2 + 6, shadow_w, shadow_h),
+                  pygame.Rect(-w//2, -h//2, w + 6, h + 6),
+                  pygame.Rect(-w//2, -h//4 - 12, self._wing.get_width(), self._wing.get_height() + 24)]
+        head_size = self._head_r.get_size()
+        self._bounds_r = pygame.Rect((w//3, -h//2 - 2), head_size).unionall(common)
+        self._bounds_l = pygame.Rect((-w//3 - head_size[0], -h//2 - 2), head_size).unionall(common)
+
+    def _render_head(self, facing_right):
+        head_w, head_h = 34, 30
+        s = pygame.Surface((head_w + 21, head_h), pygame.SRCALPHA).convert_alpha()
+        head_rect = pygame.Rect(0 if facing_right else 21, 0, head_w, head_h)
+        pygame.draw.ellipse(s, self.head_color, head_rect)
+        # beak
+        if facing_right:
+            beak = [(head_rect.right-4, head_rect.centery), (head_rect.right+20, head_rect.centery-6), (head_rect.right+20, head_rect.centery+6)]
+        else:
+            beak = [(head_rect.left+4, head_rect.centery), (head_rect.left-20, head_rect.centery-6), (head_rect.left-20, head_rect.centery+6)]
+        pygame.draw.polygon(s, (240,200,60), beak)
+        # eye
+        eye_x = head_rect.centerx + (6 if facing_right else -6)
+        eye_y = head_rect.centery - 4
+        pygame.draw.circle(s, WHITE, (eye_x, eye_y), 5)
+        pygame.draw.circle(s, BLACK, (eye_x, eye_y), 2)
+        return s
 
     def update(self, dt):
         self.spawn_time += dt
         if self.dead:
             self.fall_speed += 600 * dt
             self.y += self.fall_speed * dt
-            self.x += 60 * dt * (1 if random.random() > 0.5 else -1)
+            self.x += 60 * dt * (1 if _RNG.random() > 0.5 else -1)
             self.hit_anim += dt
             return
         self.age += dt
         # subtle vertical wobble
-        self.y += math.sin(self.age * (2 * math.pi) / self.period) * self.amp * dt
+        self.y += _SIN_LUT[int(self.age * self._lut_step) & 255] * self.amp * dt
         self.x += self.vx * dt
         self.flap += dt * 20
 
-    def draw(self, surf):
+    def sprites(self):
+        # (source, pos) pairs in draw order: shadow, body, wing, head
         cx, cy = int(self.x), int(self.y)
-        # soft shadow below the duck: draw to an alpha surface and blit
-        shadow_w = int(self.width * 1.1)
-        shadow_h = int(self.height * 0.4)
-        shadow_surf = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0,0,0,90), (0, 0, shadow_w, shadow_h))
-        surf.blit(shadow_surf, (cx - shadow_w//2, cy + self.height//2 + 6))
-
-        # body ellipse
-        body_rect = pygame.Rect(cx - self.width//2, cy - self.height//2, self.width, self.height)
-        # subtle shading: draw two ellipses
-        dark = tuple(clamp(c-20,0,255) for c in self.body_color)
-        pygame.draw.ellipse(surf, dark, (body_rect.x+6, body_rect.y+6, body_rect.w, body_rect.h))
-        pygame.draw.ellipse(surf, self.body_color, body_rect)
-
+        # soft shadow below the duck
+        shadow = (self._shadow, (cx - self._shadow.get_width()//2, cy + self.height//2 + 6))
+        body = (self._body, (cx - self.width//2, cy - self.height//2))
         # wing - flap animation (slightly rotated by sin)
-        wing_offset = int(math.sin(self.flap) * 12)
-        wing_rect = pygame.Rect(cx - self.width//2, cy - self.height//4 - wing_offset, int(self.width*0.9), int(self.height*0.6))
-        pygame.draw.ellipse(surf, self.wing_color, wing_rect)
-
-        # head
-        head_w, head_h = 34, 30
-        head_x = cx + (self.width//3) * (1 if self.vx > 0 else -1) - (0 if self.vx > 0 else head_w)
-        head_rect = pygame.Rect(head_x, cy - self.height//2 - 2, head_w, head_h)
-        pygame.draw.ellipse(surf, self.head_color, head_rect)
-        # beak
+        wing_offset = _WING_OFFSETS[int(self.flap * _FLAP_TO_PHASE) & 31]
+        wing = (self._wing, (cx - self.width//2, cy - self.height//4 - wing_offset))
+        # head (with beak and eye)
+        head_y = cy - self.height//2 - 2
         if self.vx > 0:
-            beak = [(head_rect.right-4, head_rect.centery), (head_rect.right+20, head_rect.centery-6), (head_rect.right+20, head_rect.centery+6)]
+            head = (self._head_r, (cx + self.width//3, head_y))
         else:
-            beak = [(head_rect.left+4, head_rect.centery), (head_rect.left-20, head_rect.centery-6), (head_rect.left-20, head_rect.centery+6)]
-        pygame.draw.polygon(surf, (240,200,60), beak)
-        # eye
-        eye_x = head_rect.centerx + (6 if self.vx > 0 else -6)
-        eye_y = head_rect.centery - 4
-        pygame.draw.circle(surf, WHITE, (eye_x, eye_y), 5)
-        pygame.draw.circle(surf, BLACK, (eye_x, eye_y), 2)
+            head = (self._head_l, (cx - self.width//3 - self._head_l.get_width(), head_y))
+        return shadow, body, wing, head
 
-    def hit_test(self, px, py):
-        # elliptical hit area
-        if self.dead:
-            return False
-        dx = px - self.x
-        dy = py - self.y
-        rx = self.width * 0.6
-        ry = self.height * 0.6
-        if (dx*dx)/(rx*rx) + (dy*dy)/(ry*ry) <= 1:
-            return True
-        return False
+    def rect(self):
+        bounds = self._bounds_r if self.vx > 0 else self._bounds_l
+        return bounds.move(int(self.x), int(self.y))
+
+_PARTICLE_CACHE = {}
+
+def _particle_surface(color, r):
+    # small filled circles, rendered once per (color, radius)
+    key = (color, r)
+    s = _PARTICLE_CACHE.get(key)
+    if s is None:
+        s = pygame.Surface((2*r, 2*r), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(s, color, (r, r), r)
+        _PARTICLE_CACHE[key] = s
+    return s
 
 class Particle:
     def __init__(self, x, y):
+        self.color = PARTICLE_COLOR
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        # (re)spawn at (x, y); lets pooled particles be reused
         self.x = x
         self.y = y
-        self.vx = random.uniform(-220, 220)
-        self.vy = random.uniform(-160, -40)
-        self.life = random.uniform(0.5, 1.1)
+        # uniform(a, b) written out: saves a Python-level call per value
+        rnd = _RNG.random
+        self.vx = -220 + 440 * rnd()
+        self.vy = -160 + 120 * rnd()
+        self.life = 0.5 + 0.6 * rnd()
         self.age = 0.0
-        self.size = random.uniform(2, 6)
-        self.color = (255, 220, 110)
+        self.size = 2 + 4 * rnd()
 
     def update(self, dt):
         self.age += dt
@@ -244,14 +391,148 @@ class Particle:
         self.x += self.vx * dt
         self.y += self.vy * dt
 
-    def draw(self, surf):
+    def sprite(self):
+        # (source, pos) pair for this particle, or None once it has faded
         t = clamp(1 - self.age / self.life, 0, 1)
         if t <= 0:
-            return
+            return None
         r = int(self.size * t)
         if r < 1:
             r = 1
-        pygame.draw.circle(surf, self.color, (int(self.x), int(self.y)), r)
+        return _particle_surface(self.color, r), (int(self.x) - r, int(self.y) - r)
+
+class ParticleList:
+    """Particles as a plain list of Particle objects (used without numpy).
+
+    Particle objects are preallocated and recycled through a free list, so
+    bursts of hits don't allocate.
+    """
+    def __init__(self, capacity=512):
+        self.items: List[Particle] = []
+        self._free: List[Particle] = [Particle(0, 0) for _ in range(capacity)]
+
+    def __len__(self):
+        return len(self.items)
+
+    def clear(self):
+        self._free.extend(self.items)
+        self.items.clear()
+
+    def emit(self, x, y, count):
+        # a full pool drops new particles rather than growing
+        free = self._free
+        for _ in range(min(count, len(free))):
+            p = free.pop()
+            p.reset(x, y)
+            self.items.append(p)
+
+    def update(self, dt):
+        # walk backwards and swap-remove dead particles; order doesn't matter
+        items = self.items
+        free = self._free
+        i = len(items) - 1
+        while i >= 0:
+            p = items[i]
+            p.update(dt)
+            if p.age > p.life:
+                items[i] = items[-1]
+                items.pop()
+                free.append(p)
+            i -= 1
+
+    def draw(self, surf):
+        """Draw all particles; returns their bounding rect, or None."""
+        seq = [item for item in (p.sprite() for p in self.items) if item]
+        if not seq:
+            return None
+        batch_blit(surf, seq)
+        return pygame.Rect(seq[0][1], seq[0][0].get_size()).unionall(
+            [pygame.Rect(pos, src.get_size()) for src, pos in seq[1:]])
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _advance_particles(x, y, vx, vy, age, dt, n):
+        # one fused native loop instead of several numpy passes
+        g = np.float32(600 * dt)
+        fdt = np.float32(dt)
+        for i in range(n):
+            age[i] += fdt
+            vy[i] += g
+            x[i] += vx[i] * fdt
+            y[i] += vy[i] * fdt
+else:
+    _advance_particles = None
+
+class ParticlePool:
+    """Particles as parallel numpy arrays, updated with vectorized ops."""
+    FIELDS = ('x', 'y', 'vx', 'vy', 'age', 'life', 'size')
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.n = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self._rng = np.random.default_rng()
+        if _advance_particles is not None:
+            # pay the JIT compile cost now rather than on the first hit
+            _advance_particles(self.x, self.y, self.vx, self.vy, self.age, 0.0, 0)
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def emit(self, x, y, count):
+        # a full pool drops new particles rather than growing
+        count = min(count, self.capacity - self.n)
+        if count <= 0:
+            return
+        s = slice(self.n, self.n + count)
+        uniform = self._rng.uniform
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = uniform(-220, 220, count)
+        self.vy[s] = uniform(-160, -40, count)
+        self.life[s] = uniform(0.5, 1.1, count)
+        self.age[s] = 0.0
+        self.size[s] = uniform(2, 6, count)
+        self.n += count
+
+    def update(self, dt):
+        n = self.n
+        if not n:
+            return
+        if _advance_particles is not None:
+            _advance_particles(self.x, self.y, self.vx, self.vy, self.age, dt, n)
+        else:
+            self.age[:n] += dt
+            self.vy[:n] += 600 * dt
+            self.x[:n] += self.vx[:n] * dt
+            self.y[:n] += self.vy[:n] * dt
+        # compact the survivors to the front of the arrays
+        mask = self.age[:n] <= self.life[:n]
+        alive = int(np.count_nonzero(mask))
+        if alive < n:
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[:alive] = arr[:n][mask]
+            self.n = alive
+
+    def draw(self, surf):
+        """Draw all particles; returns their bounding rect, or None."""
+        n = self.n
+        if not n:
+            return None
+        t = np.clip(1 - self.age[:n] / self.life[:n], 0, 1)
+        radii = np.maximum((self.size[:n] * t).astype(np.int32), 1)
+        xs = self.x[:n].astype(np.int32) - radii
+        ys = self.y[:n].astype(np.int32) - radii
+        batch_blit(surf, [(_particle_surface(PARTICLE_COLOR, r), (px, py))
+                          for r, px, py, live in zip(radii.tolist(), xs.tolist(), ys.tolist(), (t > 0).tolist())
+                          if live])
+        left, top = int(xs.min()), int(ys.min())
+        return pygame.Rect(left, top, int((xs + 2*radii).max()) - left, int((ys + 2*radii).max()) - top)
 
 # -------------------- Game --------------------
 class Game:
@@ -261,7 +542,7 @@ class Game:
         self.health = HEALTH_PER_LEVEL
         self.bullets = math.inf
         self.ducks: List[Duck] = []
-        self.particles: List[Particle] = []
+        self.particles = ParticlePool() if np is not None else ParticleList()
         self.hits_this_level = 0
         self.time_since_last_spawn = 0.0
         self.spawn_rate = 1.2
@@ -271,17 +552,29 @@ class Game:
         self.message_time = 0.0
         self.state = 'playing'   # playing, level_end, game_over, victory
         self.clouds = []
+        self._text_cache = {}
+        # dirty-rect tracking: rects changed by the last draw(), or None for
+        # "present the whole screen"
+        self.dirty_rects = None
+        self._full_redraw = True
+        self._vacated = []
+        self._last_particles = None
+        self._last_crosshair = None
+        self._last_message = False
+        # sky + clouds + ground, updated incrementally by _update_background
+        self._bg = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+        self._bg_valid = False
         self._make_clouds()
         self._setup_level()
 
     def _make_clouds(self):
         self.clouds = []
         for i in range(7):
-            x = random.randint(-400, SCREEN_W + 400)
-            y = random.randint(30, 180)
-            scale = random.uniform(0.6, 1.4)
-            speed = random.uniform(8, 30) * (0.5 if i % 2 == 0 else 1.0)
-            if random.random() < 0.4:
+            x = _RNG.randint(-400, SCREEN_W + 400)
+            y = _RNG.randint(30, 180)
+            scale = _RNG.uniform(0.6, 1.4)
+            speed = _RNG.uniform(8, 30) * (0.5 if i % 2 == 0 else 1.0)
+            if _RNG.random() < 0.4:
                 speed *= -1
             c = Cloud(x, y, scale, speed)
             self.clouds.append(c)
@@ -300,6 +593,7 @@ class Game:
         self.message = f'Level {self.level} — Get {DUCKS_TO_CLEAR} hits!'
         self.message_time = 2.2
         self.state = 'playing'
+        self._full_redraw = True
 
     def spawn_duck(self):
         d = Duck(self.level)
@@ -320,114 +614,151 @@ class Game:
         if self.time_since_last_spawn >= self.spawn_rate:
             self.time_since_last_spawn = 0
             self.spawn_duck()
-            if random.random() < clamp((self.level - 1) * 0.06, 0, 0.45):
+            if _RNG.random() < clamp((self.level - 1) * 0.06, 0, 0.45):
                 self.spawn_duck()
 
-        # update ducks
-        for d in list(self.ducks):
+        # update ducks, compacting escaped and fallen ones out in place
+        # (keeps draw order stable, unlike a swap-remove)
+        escaped = 0
+        ducks = self.ducks
+        kept = 0
+        for d in ducks:
             d.update(dt)
-            # escaped ducks
             if not d.dead:
                 if d.x < -140 or d.x > SCREEN_W + 140:
                     # duck escaped
-                    try:
-                        self.ducks.remove(d)
-                    except ValueError:
-                        pass
-                    self.health -= 1
-                    self.message = 'Duck escaped! -1 health'
-                    self.message_time = 1.6
-                    if self.health <= 0:
-                        self._on_level_failed()
+                    escaped += 1
+                    self._vacate(d)
+                    continue
             else:
                 # remove after falling past ground or long enough
                 if d.y > SCREEN_H + 120 or d.hit_anim > 3.0:
-                    try:
-                        self.ducks.remove(d)
-                    except ValueError:
-                        pass
+                    self._vacate(d)
+                    continue
+            ducks[kept] = d
+            kept += 1
+        del ducks[kept:]
+        if escaped:
+            self.health -= escaped
+            self.message = 'Duck escaped! -1 health'
+            self.message_time = 1.6
+            if self.health <= 0:
+                self._on_level_failed()
 
         # update particles
-        for p in list(self.particles):
-            p.update(dt)
-            if p.age > p.life:
-                try:
-                    self.particles.remove(p)
-                except ValueError:
-                    pass
+        self.particles.update(dt)
 
         # level completion
         if self.hits_this_level >= DUCKS_TO_CLEAR:
             self._on_level_cleared()
 
+    def _vacate(self, d):
+        # the area a removed duck covered still has to be presented once more
+        if d.last_rect:
+            self._vacated.append(d.last_rect)
+
+    def _text(self, s):
+        # HUD labels change rarely, so keep the rendered surfaces around
+        cached = self._text_cache.pop(s, None)
+        if cached is None:
+            cached = font.render(s, True, BLACK).convert_alpha()
+            if len(self._text_cache) >= 64:
+                # evict the least recently used entry
+                del self._text_cache[next(iter(self._text_cache))]
+        self._text_cache[s] = cached
+        return cached
+
     def draw_hud(self, surf):
         # hud background
         pygame.draw.rect(surf, (255,255,255,230), (8, 8, SCREEN_W - 16, 46), border_radius=8)
         # level
-        lv = font.render(f'Level: {self.level}/{TOTAL_LEVELS}', True, BLACK)
+        lv = self._text(f'Level: {self.level}/{TOTAL_LEVELS}')
         surf.blit(lv, (18, 14))
         # score
-        sc = font.render(f'Score: {self.score}', True, BLACK)
+        sc = self._text(f'Score: {self.score}')
         surf.blit(sc, (170, 14))
         # health hearts
         hx = 320
         for i in range(HEALTH_PER_LEVEL):
-            r = pygame.Rect(hx + i*30, 12, 24, 24)
-            if i < self.health:
-                # draw a heart (simple)
-                pygame.draw.ellipse(surf, (255,80,90), (r.x+4, r.y+6, 12, 12))
-                pygame.draw.ellipse(surf, (255,80,90), (r.x+12, r.y+6, 12, 12))
-                points = [(r.x+4, r.y+12), (r.x+12, r.y+22), (r.x+20, r.y+12)]
-                pygame.draw.polygon(surf, (255,80,90), points)
-            else:
-                pygame.draw.ellipse(surf, (220,220,220), (r.x+4, r.y+6, 12, 12))
-                pygame.draw.ellipse(surf, (220,220,220), (r.x+12, r.y+6, 12, 12))
-                points = [(r.x+4, r.y+12), (r.x+12, r.y+22), (r.x+20, r.y+12)]
-                pygame.draw.polygon(surf, (220,220,220), points)
+            surf.blit(_HEART_FULL if i < self.health else _HEART_EMPTY, (hx + i*30, 12))
         # bullets
         bx = 520
         btxt = '∞' if math.isinf(self.bullets) else str(int(self.bullets))
-        bl = font.render(f'Bullets: {btxt}', True, BLACK)
+        bl = self._text(f'Bullets: {btxt}')
         surf.blit(bl, (bx, 14))
         # hits
-        hits = font.render(f'Hits: {self.hits_this_level}/{DUCKS_TO_CLEAR}', True, BLACK)
+        hits = self._text(f'Hits: {self.hits_this_level}/{DUCKS_TO_CLEAR}')
         surf.blit(hits, (700, 14))
 
-    def draw(self, surf):
+    def _update_background(self, dirty):
+        # repaint the cached background only where a cloud moved a whole pixel
+        moved = []
+        for c in self.clouds:
+            r = c.rect()
+            if r != c.last_rect:
+                moved.append(r.union(c.last_rect) if c.last_rect else r)
+                c.last_rect = r
+        if self._bg_valid and not moved:
+            return
+        bg = self._bg
+        bg.set_clip(moved[0].unionall(moved[1:]) if self._bg_valid else None)
         # background sky
-        draw_sky_gradient(surf)
+        draw_sky_gradient(bg)
         # clouds (drawed behind ducks)
         for c in self.clouds:
-            c.draw(surf)
+            c.draw(bg)
         # ground / horizon
-        pygame.draw.rect(surf, GRASS, (0, SCREEN_H - 120, SCREEN_W, 120))
-        # subtle ground stripes
-        for i in range(0, SCREEN_W, 60):
-            pygame.draw.rect(surf, GROUND_DARK, (i, SCREEN_H - 80, 30, 80))
+        bg.blit(_GROUND, (0, SCREEN_H - 120))
+        bg.set_clip(None)
+        self._bg_valid = True
+        dirty.extend(moved)
 
-        # ducks
+    def draw(self, surf):
+        # each moving thing contributes the union of its old and new rects
+        dirty = self._vacated
+        self._vacated = []
+
+        # sky, clouds and ground come from the cached background
+        self._update_background(dirty)
+        surf.blit(self._bg, (0, 0))
+
+        # ducks: a single batch in per-duck order, so overlapping ducks stack
+        # as before; skip the ones entirely off-screen (entering, escaping, falling)
+        visible = []
         for d in self.ducks:
-            d.draw(surf)
+            r = d.rect()
+            dirty.append(r.union(d.last_rect) if d.last_rect else r)
+            d.last_rect = r
+            if _on_screen(r):
+                visible.append(d)
+        batch_blit(surf, [s for d in visible for s in d.sprites()])
 
         # particles
-        for p in self.particles:
-            p.draw(surf)
+        r = self.particles.draw(surf)
+        if r and self._last_particles:
+            dirty.append(r.union(self._last_particles))
+        elif r or self._last_particles:
+            dirty.append(r or self._last_particles)
+        self._last_particles = r
 
         # HUD
         self.draw_hud(surf)
+        dirty.append(pygame.Rect(8, 8, SCREEN_W - 16, 46))
 
         # draw crosshair at mouse
         mx, my = pygame.mouse.get_pos()
-        pygame.draw.circle(surf, WHITE, (mx, my), 12, 2)
-        pygame.draw.line(surf, WHITE, (mx-22, my), (mx-8, my), 2)
-        pygame.draw.line(surf, WHITE, (mx+8, my), (mx+22, my), 2)
-        pygame.draw.line(surf, WHITE, (mx, my-22), (mx, my-8), 2)
-        pygame.draw.line(surf, WHITE, (mx, my+8), (mx, my+22), 2)
+        r = surf.blit(_CROSSHAIR, (mx - 24, my - 24))
+        dirty.append(r.union(self._last_crosshair) if self._last_crosshair else r)
+        self._last_crosshair = r
 
         # message
-        if self.message_time > 0 and self.message:
+        shown = self.message_time > 0 and bool(self.message)
+        if shown:
             msg = smallfont.render(self.message, True, BLACK)
             surf.blit(msg, (SCREEN_W//2 - msg.get_width()//2, 64))
+        if shown or self._last_message:
+            dirty.append(pygame.Rect(0, 64, SCREEN_W, smallfont.get_height()))
+        self._last_message = shown
 
         # overlays for states
         if self.state == 'level_end':
@@ -446,6 +777,17 @@ class Game:
             sub = font.render('You cleared all levels. Click to restart.', True, BLACK)
             surf.blit(sub, (SCREEN_W//2 - sub.get_width()//2, SCREEN_H//2 - 10))
 
+        # overlays and level changes repaint everything; so does a frame with
+        # so many rects that per-rect overhead outweighs a full flip
+        screen_rect = surf.get_rect()
+        dirty = [r.clip(screen_rect) for r in dirty]
+        dirty = [r for r in dirty if r.w and r.h]
+        if self._full_redraw or self.state != 'playing' or len(dirty) > 50:
+            self.dirty_rects = None
+        else:
+            self.dirty_rects = dirty
+        self._full_redraw = self.state != 'playing'
+
     def shoot_at(self, x, y):
         if self.state != 'playing':
             return
@@ -455,31 +797,46 @@ class Game:
             return
         if not math.isinf(self.bullets):
             self.bullets -= 1
-        # hit test sorted by nearest
-        hit_any = False
-        for d in sorted(self.ducks, key=lambda k: math.hypot(k.x - x, k.y - y)):
-            if d.hit_test(x, y):
-                hit_any = True
-                d.dead = True
-                d.fall_speed = 80 + random.random()*80
-                self.score += 100 + self.level * 20
-                self.hits_this_level += 1
-                # particles
-                for _ in range(16):
-                    self.particles.append(Particle(d.x, d.y))
-                self.message = 'Hit!'
-                self.message_time = 1.2
-                # play sound if available
-                try:
-                    if SOUND_ENABLED and sound_hit:
-                        sound_hit.play()
-                except Exception:
-                    pass
-                break
-        if not hit_any:
+        # nearest duck whose elliptical hit area contains the shot
+        best = None
+        best_d2 = math.inf
+        for d in self.ducks:
+            if d.dead:
+                continue
+            dx = x - d.x
+            dy = y - d.y
+            d2 = dx*dx + dy*dy
+            if d2 >= best_d2:
+                continue
+            # elliptical hit area, reusing dx/dy
+            rx = d.width * 0.6
+            ry = d.height * 0.6
+            if (dx*dx)/(rx*rx) + (dy*dy)/(ry*ry) <= 1:
+                best = d
+                best_d2 = d2
+        if best is not None:
+            d = best
+            d.dead = True
+            d.fall_speed = 80 + _RNG.random()*80
+            self.score += 100 + self.level * 20
+            self.hits_this_level += 1
+            # particles
+            self.particles.emit(d.x, d.y, 16)
+            self.message = 'Hit!'
+            self.message_time = 1.2
+            # play sound if available
+            try:
+                if SOUND_ENABLED and sound_hit:
+                    sound_hit.play()
+            except Exception:
+                pass
+        else:
             self.message = 'Miss!'
             self.message_time = 0.9
 
+    def request_full_redraw(self):
+        self._full_redraw = True
+
     def on_click(self, x, y):
         if self.state == 'playing':
             self.shoot_at(x, y)
@@ -515,11 +872,14 @@ class Game:
 def main():
     game = Game()
     running = True
+    # time at which the next physics step is due
+    next_step = time.perf_counter()
     while running:
-        dt = clock.tick(FPS) / 1000.0
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                game.request_full_redraw()
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mx, my = pygame.mouse.get_pos()
                 game.on_click(mx, my)
@@ -535,13 +895,33 @@ def main():
         if not running:
             break
 
-        if not game.paused:
-            game.update(dt)
-
-        # draw everything
-        game.draw(screen)
+        # physics runs in fixed steps; a slow frame catches up with several
+        # steps before the next draw instead of one big, distorted step
+        now = time.perf_counter()
+        if now - next_step > MAX_FRAME_TIME:
+            # stalled (e.g. window drag): drop the backlog beyond the cap
+            next_step = now - MAX_FRAME_TIME
+        steps = 0
+        while next_step <= now:
+            if not game.paused:
+                game.update(FIXED_DT)
+            next_step += FIXED_DT
+            steps += 1
+
+        # draw only when the world advanced; re-presenting an unchanged
+        # frame shows up as a hitch
+        if steps:
+            game.draw(screen)
+            if game.dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(game.dirty_rects)
 
-        pygame.display.flip()
+        # pace rendering to the physics rate: sleep until the next step is
+        # due (sleep never returns early, so the next pass runs >= 1 step)
+        delay = next_step - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
 
     pygame.quit()
     sys.exit()